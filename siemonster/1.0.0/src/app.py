@@ -19,6 +19,7 @@ class Siemonster(AppBase):
         :param console_logger:
         """
         super().__init__(redis, logger, console_logger)
+        self.es_session = requests.Session()
 
     def ping(self, username, password, url):
         message = f"SIEMonster welcomes from {socket.gethostname()} in workflow {self.current_execution_id}!"
@@ -29,14 +30,14 @@ class Siemonster(AppBase):
         return message
 
     def es_get_cluster_health(self, username, password, url):
-        return requests.get(url + "/_cluster/health", auth=(username, password), verify=False).text
+        return self.es_session.get(url + "/_cluster/health", auth=(username, password), verify=False).text
 
     def es_query(self, method, username, password, url, path, body):
         headers = {
             "Accept": "application/json",
             "Content-type": "application/json",
         }
-        return requests.request(method, url + path, auth=(username, password), data=body, headers=headers, verify=False).text
+        return self.es_session.request(method, url + path, auth=(username, password), data=body, headers=headers, verify=False).text
 
 if __name__ == "__main__":
     Siemonster.run()